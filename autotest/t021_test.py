@@ -26,5 +26,40 @@ def test_mflist_external():
     assert np.array_equal(ml.wel[1], ml1.wel[1])
 
 
+def test_list_options_load():
+    ml = flopy.modflow.Modflow("options_test", model_ws=mpth)
+    dis = flopy.modflow.ModflowDis(ml, 1, 10, 10, nper=1, perlen=1.0)
+    fname = os.path.join(mpth, "options_test.ghb")
+    f = open(fname, 'w')
+    f.write('# GHB file with options\n')
+    f.write('         2         0  NOPRINT  AUX IFACE\n')
+    f.write('         2         0\n')
+    f.write('         1         1         1      10.0     100.0  6\n')
+    f.write('         1         2         2      11.0     100.0  5\n')
+    f.close()
+
+    ghb = flopy.modflow.ModflowGhb.load(fname, ml)
+    assert ghb.options == ['NOPRINT', 'AUX IFACE']
+    spd = ghb.stress_period_data[0]
+    assert 'iface' in spd.dtype.names
+    assert np.array_equal(spd['iface'], [6, 5])
+    assert np.array_equal(spd['j'], [0, 1])
+
+
+def test_list_recarray_cast():
+    ml = flopy.modflow.Modflow("cast_test", model_ws=mpth)
+    dis = flopy.modflow.ModflowDis(ml, 1, 10, 10, nper=1, perlen=1.0)
+    dtype = np.dtype([('k', np.int64), ('i', np.int64), ('j', np.int64),
+                      ('bhead', np.float64), ('cond', np.float64)])
+    ra = np.rec.fromrecords([(0, 1, 2, 10.0, 100.0)], dtype=dtype)
+    ghb = flopy.modflow.ModflowGhb(ml, stress_period_data={0: ra})
+    spd = ghb.stress_period_data[0]
+    assert spd.dtype == ghb.dtype
+    assert spd['j'][0] == 2
+    assert spd['bhead'][0] == 10.0
+
+
 if __name__ == '__main__':
     test_mflist_external()
+    test_list_options_load()
+    test_list_recarray_cast()
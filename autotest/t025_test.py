@@ -3,6 +3,7 @@ Some basic tests for LAKE load.
 """
 
 import os
+import numpy as np
 import flopy
 
 path = os.path.join('..', 'examples', 'data', 'mf2005_test')
@@ -100,6 +101,80 @@ def test_mf2005load():
     return
 
 
+def test_lake_default_stages():
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    m = flopy.modflow.Modflow('lakdef', model_ws=cpth)
+    dis = flopy.modflow.ModflowDis(m, 1, 5, 5, nper=1)
+    lakarr = np.zeros((1, 5, 5), dtype=np.int)
+    lakarr[0, 1:3, 1:3] = 1
+    lakarr[0, 3, 3] = 2
+    bdlknc = np.zeros((1, 5, 5), dtype=np.float32)
+    bdlknc[0] = 0.1
+    flux_data = {0: {0: [0.] * 6, 1: [0.] * 6}}
+    lak = flopy.modflow.ModflowLak(m, nlakes=2, lakarr=lakarr,
+                                   bdlknc=bdlknc, flux_data=flux_data,
+                                   sill_data={})
+    assert np.array_equal(lak.stages, [1., 1.])
+    lak.write_file()
+
+    m2 = flopy.modflow.Modflow('lakdef2', model_ws=cpth)
+    dis2 = flopy.modflow.ModflowDis(m2, 1, 5, 5, nper=1)
+    lak2 = flopy.modflow.ModflowLak.load(lak.fn_path, m2)
+    assert lak2.nlakes == 2
+    assert np.array_equal(np.array(lak2.stages, dtype=np.float), [1., 1.])
+    assert np.array_equal(lak2.stage_range, lak.stage_range)
+    assert np.array_equal(lak2.lakarr[0].array, lakarr)
+    assert np.allclose(lak2.bdlknc[0].array, bdlknc)
+    return
+
+
+def test_lake_flux_data():
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    m = flopy.modflow.Modflow('lakflx', model_ws=cpth)
+    dis = flopy.modflow.ModflowDis(m, 1, 5, 5, nper=2, steady=True)
+    lakarr = np.zeros((1, 5, 5), dtype=np.int)
+    lakarr[0, 1:3, 1:3] = 1
+    lakarr[0, 3, 3] = 2
+    bdlknc = np.zeros((1, 5, 5), dtype=np.float32)
+    bdlknc[0] = 0.1
+    flux = np.arange(12, dtype=np.float).reshape(2, 6)
+    lak = flopy.modflow.ModflowLak(m, nlakes=2, stages=[1., 2.],
+                                   stage_range=[(0., 5.), (1., 6.)],
+                                   lakarr=lakarr, bdlknc=bdlknc,
+                                   flux_data={0: 0.5, 1: flux},
+                                   sill_data={})
+    assert lak.flux_data[0] == {0: [0.5] * 6, 1: [0.5] * 6}
+    assert lak.flux_data[1] == {0: flux[0].tolist(), 1: flux[1].tolist()}
+    lak.write_file()
+
+    # check the dataset 9 records that were written
+    ds9 = []
+    for line in open(lak.fn_path):
+        if 'Data set 9a' in line:
+            ds9.append([float(v) for v in line.split('#')[0].split()])
+    assert ds9 == [[0.5] * 4, [0.5] * 4, flux[0].tolist(), flux[1].tolist()]
+
+    # steady periods after the first need all six flux_data entries
+    try:
+        flopy.modflow.ModflowLak(m, nlakes=2, stages=[1., 2.],
+                                 stage_range=[(0., 5.), (1., 6.)],
+                                 lakarr=lakarr, bdlknc=bdlknc,
+                                 flux_data={0: 0.5, 1: flux[:, :4]},
+                                 sill_data={})
+        msg = None
+    except Exception as e:
+        msg = str(e)
+    assert msg is not None, \
+        'a 4 column flux_data array should fail for period 2'
+    assert 'flux_data entry for stress period 2' in msg, msg
+    assert 'should have 6 entries' in msg, msg
+    return
+
+
 if __name__ == '__main__':
     for namfile, pth in zip(mf_items, pths):
         load_lak(namfile, pth, run)
+    test_lake_default_stages()
+    test_lake_flux_data()
@@ -12,6 +12,16 @@ import numpy as np
 from ..pakbase import Package
 from ..utils import MfList
 
+# default ghb dtypes for structured and unstructured grids
+_DEFAULT_DTYPE = np.dtype([("k", np.int32), ("i", np.int32),
+                           ("j", np.int32), ("bhead", np.float32),
+                           ("cond", np.float32)])
+_DEFAULT_DTYPE_USG = np.dtype([("node", np.int32), ("bhead", np.float32),
+                               ("cond", np.float32)])
+
+# ghb dtypes with auxiliary variables keyed by (aux_names, structured)
+_aux_dtypes = {}
+
 
 class ModflowGhb(Package):
     """
@@ -61,7 +71,9 @@ class ModflowGhb(Package):
         stress_period_data can be found in the flopy3boundaries Notebook in
         the basic subdirectory of the examples directory
     dtype : dtype definition
-        if data type is different from default 
+        if data type is different from default. The default uses np.int32
+        for the cell indices; recarrays with the same fields and other
+        numeric types are cast to the package dtype.
     options : list of strings
         Package options. (default is None).
     extension : string
@@ -188,12 +200,11 @@ class ModflowGhb(Package):
         """
         if check: # allows turning off package checks when writing files at model level
             self.check(f='{}.chk'.format(self.name[0]), verbose=self.parent.verbose, level=1)
-        f_ghb = open(self.fn_path, 'w')
-        f_ghb.write('{}\n'.format(self.heading))
-        f_ghb.write('{:10d}{:10d}'.format(self.stress_period_data.mxact, self.ipakcb))
-        for option in self.options:
-            f_ghb.write('  {}'.format(option))
-        f_ghb.write('\n')
+        f_ghb = open(self.fn_path, 'w', 1 << 20)
+        options = ''.join('  {}'.format(option) for option in self.options)
+        f_ghb.write('{}\n{:10d}{:10d}{}\n'.format(self.heading,
+                                                  self.stress_period_data.mxact,
+                                                  self.ipakcb, options))
         self.stress_period_data.write_transient(f_ghb)
         f_ghb.close()
 
@@ -206,23 +217,36 @@ class ModflowGhb(Package):
     @staticmethod
     def get_empty(ncells=0, aux_names=None, structured=True):
         # get an empty recaray that correponds to dtype
-        dtype = ModflowGhb.get_default_dtype(structured=structured)
-        if aux_names is not None:
-            dtype = Package.add_to_dtype(dtype, aux_names, np.float32)
-        d = np.zeros((ncells, len(dtype)), dtype=dtype)
-        d[:, :] = -1.0E+10
-        return np.core.records.fromarrays(d.transpose(), dtype=dtype)
+        dtype = ModflowGhb._dtype_with_aux(aux_names, structured=structured)
+        d = np.zeros(ncells, dtype=dtype).view(np.recarray)
+        for name in dtype.names:
+            if dtype[name].kind == 'i':
+                d[name] = -1
+            else:
+                d[name] = -1.0E+10
+        return d
+
+    @staticmethod
+    def _dtype_with_aux(aux_names=None, structured=True):
+        # get the default dtype with any auxiliary variables appended
+        if not aux_names:
+            return ModflowGhb.get_default_dtype(structured=structured)
+        if not isinstance(aux_names, (list, tuple)):
+            aux_names = [aux_names]
+        key = (tuple(aux_names), structured)
+        dtype = _aux_dtypes.get(key)
+        if dtype is None:
+            dtype = ModflowGhb.get_default_dtype(structured=structured)
+            dtype = Package.add_to_dtype(dtype, list(aux_names), np.float32)
+            _aux_dtypes[key] = dtype
+        return dtype
 
     @staticmethod
     def get_default_dtype(structured=True):
         if structured:
-            dtype = np.dtype([("k", np.int), ("i", np.int),
-                              ("j", np.int), ("bhead", np.float32),
-                              ("cond", np.float32)])
+            return _DEFAULT_DTYPE
         else:
-            dtype = np.dtype([("node", np.int), ("bhead", np.float32),
-                              ("cond", np.float32)])
-        return dtype
+            return _DEFAULT_DTYPE_USG
 
     @staticmethod
     def load(f, model, nper=None, ext_unit_dict=None, check=True):
@@ -280,7 +280,7 @@ class ModflowHfb(Package):
             while it < len(t):
                 toption = t[it]
                 #print it, t[it]
-                if toption.lower() is 'noprint':
+                if toption.lower() == 'noprint':
                     options.append(toption)
                 elif 'aux' in toption.lower():
                     options.append(' '.join(t[it:it + 2]))
@@ -10,9 +10,14 @@ MODFLOW Guide
 import os
 import sys
 import numpy as np
+if sys.version_info[0] == 2:
+    from StringIO import StringIO
+else:
+    from io import StringIO
 from ..pakbase import Package
 from ..utils.util_array import Transient3d
-from ..utils import Util3d, read_fixed_var, write_fixed_var
+from ..utils import Util3d, read_fixed_var, write_fixed_var, \
+    fixed_fmt_string
 
 
 class ModflowLak(Package):
@@ -123,9 +128,7 @@ class ModflowLak(Package):
                     raise ValueError(msg)
             # set unit for tab files if not passed to __init__
             if tab_units is None:
-                tab_units = []
-                for idx in range(len(tab_files)):
-                    tab_units.append(model.next_ext_unit())
+                tab_units = [model.next_ext_unit() for fname in tab_files]
             # add tabfiles as external files
             for iu, fname in zip(tab_units, tab_files):
                 model.add_external(fname, iu)
@@ -143,8 +146,7 @@ class ModflowLak(Package):
                          unit_number=units, extra=extra, filenames=fname)
 
         self.heading = '# {} package for '.format(self.name[0]) + \
-                       ' {}, '.format(model.version_types[model.version]) + \
-                       'generated by Flopy.'
+                       '{}, generated by Flopy.'.format(model.version)
         self.url = 'lak.htm'
 
         if options is None:
@@ -157,7 +159,7 @@ class ModflowLak(Package):
         self.sscncr = sscncr
         self.surfdep = surfdep
         if isinstance(stages, float):
-            stages = np.array(self.nlakes, dtype=np.float) * stages
+            stages = np.full(self.nlakes, stages, dtype=np.float)
         elif isinstance(stages, list):
             stages = np.array(stages)
         if stages.shape[0] != nlakes:
@@ -166,7 +168,7 @@ class ModflowLak(Package):
             raise Exception(err)
         self.stages = stages
         if stage_range is None:
-            stage_range = np.ones((nlakes, 2), dtype=np.float)
+            stage_range = np.empty((nlakes, 2), dtype=np.float)
             stage_range[:, 0] = -10000.
             stage_range[:, 1] = 10000.
         else:
@@ -199,51 +201,45 @@ class ModflowLak(Package):
 
         if sill_data is not None:
             if not isinstance(sill_data, dict):
-                try:
-                    sill_data = {0: sill_data}
-                except:
-                    err = 'sill_data must be a dictionary'
-                    raise Exception(err)
+                sill_data = {0: sill_data}
 
         if flux_data is not None:
             if not isinstance(flux_data, dict):
                 # convert array to a dictionary
+                flux_data = {0: flux_data}
+            for key, value in flux_data.items():
                 try:
-                    flux_data = {0: flux_data}
+                    steady = self.parent.dis.steady[key]
                 except:
-                    err = 'flux_data must be a dictionary'
-                    raise Exception(err)
-            for key, value in flux_data.items():
+                    steady = True
+                nlen = 4
+                if steady and key > 0:
+                    nlen = 6
+                msg = 'flux_data entry for stress period {} '.format(key + 1)
                 if isinstance(value, np.ndarray):
-                    td = {}
-                    for k in range(value.shape[0]):
-                        td[k] = value[k, :].aslist()
-                    flux_data[key] = td
-                    if len(list(flux_data.keys())) != nlakes:
+                    if value.shape[0] != nlakes:
                         err = 'flux_data dictionary must ' + \
                               'have {} entries'.format(nlakes)
                         raise Exception(err)
-                elif isinstance(value, float) or \
-                        isinstance(value, int):
-                    td = {}
-                    for k in range(self.nlakes):
-                        td[k] = (np.ones(6, dtype=np.float) * value).aslist()
-                    flux_data[key] = td
+                    if value.ndim != 2 or value.shape[1] < nlen:
+                        ncol = 1
+                        if value.ndim > 1:
+                            ncol = value.shape[1]
+                        err = msg + 'has {} entries but '.format(ncol) + \
+                              'should have {} entries'.format(nlen)
+                        raise Exception(err)
+                    td = value.tolist()
+                    flux_data[key] = {k: td[k] for k in range(nlakes)}
+                elif isinstance(value, (int, float)):
+                    td = np.full((nlakes, 6), value, dtype=np.float).tolist()
+                    flux_data[key] = {k: td[k] for k in range(nlakes)}
                 elif isinstance(value, dict):
-                    try:
-                        steady = self.parent.dis.steady[key]
-                    except:
-                        steady = True
-                    nlen = 4
-                    if steady and key > 0:
-                        nlen = 6
                     for k in range(self.nlakes):
                         td = value[k]
                         if len(td) < nlen:
-                            err = 'flux_data entry for stress period'.format(
-                                key + 1) + \
-                                  'has {} entries but '.format(nlen) + \
-                                  'should have {} entries'.format(len(td))
+                            err = msg + \
+                                  'has {} entries but '.format(len(td)) + \
+                                  'should have {} entries'.format(nlen)
                             raise Exception(err)
 
         self.flux_data = flux_data
@@ -268,105 +264,99 @@ class ModflowLak(Package):
         None
 
         """
-        f = open(self.fn_path, 'w')
+        parts = []
+        append = parts.append
+        free = self.parent.free_format_input
         # dataset 0
-        self.heading = '# {} package for '.format(self.name[0]) + \
-                       '{}, generated by Flopy.'.format(self.parent.version)
-        f.write('{0}\n'.format(self.heading))
+        append('{0}\n'.format(self.heading))
 
         # dataset 1a
         if len(self.options) > 0:
             for option in self.options:
-                f.write('{} '.format(option))
-            f.write('\n')
+                append('{} '.format(option))
+            append('\n')
 
         # dataset 1b
-        f.write(write_fixed_var([self.nlakes, self.ipakcb],
-                                free=self.parent.free_format_input))
+        append(write_fixed_var([self.nlakes, self.ipakcb], free=free))
         # dataset 2
-        steady = np.any(self.parent.dis.steady.array)
+        steady_arr = np.asarray(self.parent.dis.steady.array)
+        steady = np.any(steady_arr)
         t = [self.theta]
         if self.theta < 0. or steady:
             t.append(self.nssitr)
             t.append(self.sscncr)
         if self.theta < 0.:
             t.append(self.surfdep)
-        f.write(write_fixed_var(t, free=self.parent.free_format_input))
+        append(write_fixed_var(t, free=free))
 
         # dataset 3
-        steady = self.parent.dis.steady[0]
+        steady = steady_arr[0]
+        ipos = (10,)
+        if steady:
+            ipos += (10, 10)
+        if self.tabdata:
+            ipos += (5,)
+        fmt3 = fixed_fmt_string(ipos, free) + '\n'
         for n in range(self.nlakes):
-            ipos = [10]
             t = [self.stages[n]]
             if steady:
-                ipos.append(10)
                 t.append(self.stage_range[n, 0])
-                ipos.append(10)
                 t.append(self.stage_range[n, 1])
             if self.tabdata:
-                ipos.append(5)
                 t.append(self.iunit_tab[n])
-            f.write(write_fixed_var(t, ipos=ipos,
-                                    free=self.parent.free_format_input))
+            append(fmt3.format(*t))
 
-        ds8_keys = list(self.sill_data.keys())
-        ds9_keys = list(self.flux_data.keys())
-        nper = self.parent.dis.steady.shape[0]
+        nper = steady_arr.shape[0]
+        fmt9 = {ncol: fixed_fmt_string((10,) * ncol, free) +
+                      '  # Data set 9a\n' for ncol in (4, 6)}
+        # dataset 4 record, reused for every stress period
+        t_buf = [0, 0, 1]
         for kper in range(nper):
             itmp, file_entry_lakarr = self.lakarr.get_kper_entry(kper)
-            ibd, file_entry_bdlknc = self.bdlknc.get_kper_entry(kper)
 
             itmp2 = 0
-            if kper in ds9_keys:
+            if kper in self.flux_data:
                 itmp2 = 1
 
-            t = [itmp, itmp2, 1]
+            t_buf[0] = itmp
+            t_buf[1] = itmp2
             comment = 'Stress period {}'.format(kper + 1)
-            f.write(write_fixed_var(t, free=self.parent.free_format_input,
-                                    comment=comment))
+            append(write_fixed_var(t_buf, free=free, comment=comment))
 
             if itmp > 0:
-                f.write(file_entry_lakarr)
-                f.write(file_entry_bdlknc)
+                ibd, file_entry_bdlknc = self.bdlknc.get_kper_entry(kper)
+                parts.extend((file_entry_lakarr, file_entry_bdlknc))
 
                 nslms = 0
-                if kper in ds8_keys:
+                if kper in self.sill_data:
                     ds8 = self.sill_data[kper]
                     nslms = len(ds8)
 
-                f.write(write_fixed_var([nslms], length=5,
-                                        free=self.parent.free_format_input,
-                                        comment='Data set 7'))
+                append(write_fixed_var([nslms], length=5, free=free,
+                                      comment='Data set 7'))
                 if nslms > 0:
                     for n in range(nslms):
                         d1, d2 = ds8[n]
-                        s = write_fixed_var(d1, length=5,
-                                            free=self.parent.free_format_input,
+                        s = write_fixed_var(d1, length=5, free=free,
                                             comment='Data set 8a')
-                        f.write(s)
-                        s = write_fixed_var(d2,
-                                            free=self.parent.free_format_input,
+                        append(s)
+                        s = write_fixed_var(d2, free=free,
                                             comment='Data set 8b')
-                        f.write(s)
+                        append(s)
 
             if itmp2 > 0:
                 ds9 = self.flux_data[kper]
-                for n in range(self.nlakes):
-                    try:
-                        steady = self.parent.dis.steady[kper]
-                    except:
-                        steady = True
-                    if kper > 0 and steady:
-                        t = ds9[n]
-                    else:
-                        t = ds9[n][0:4]
-                    s = write_fixed_var(t,
-                                        free=self.parent.free_format_input,
-                                        comment='Data set 9a')
-                    f.write(s)
-
-        # close the lak file
-        f.close()
+                if kper > 0 and steady_arr[kper]:
+                    nflx = 6
+                else:
+                    nflx = 4
+                fmt = fmt9[nflx]
+                append(''.join(fmt.format(*ds9[n][0:nflx])
+                               for n in range(self.nlakes)))
+
+        # write the lak file in a single call
+        with open(self.fn_path, 'w', 1 << 20) as f:
+            f.write(''.join(parts))
 
     @staticmethod
     def load(f, model, nper=None, ext_unit_dict=None):
@@ -407,7 +397,8 @@ class ModflowLak(Package):
         if model.verbose:
             sys.stdout.write('loading lak package file...\n')
 
-        if not hasattr(f, 'read'):
+        openfile = not hasattr(f, 'read')
+        if openfile:
             filename = f
             if sys.version_info[0] == 2:
                 f = open(filename, 'r')
@@ -420,6 +411,15 @@ class ModflowLak(Package):
             if line[0] != '#':
                 break
 
+        # read the rest of the file in one call and parse it from memory;
+        # keep the file name so Util3d.load can match the current unit
+        fname = getattr(f, 'name', None)
+        text = f.read()
+        if openfile:
+            f.close()
+        f = StringIO(text)
+        f.name = fname
+
         options = []
         tabdata = False
         if 'TABLEINPUT' in line.upper():
@@ -555,30 +555,25 @@ class ModflowLak(Package):
                 if model.verbose:
                     print("   reading lak dataset 9 - " +
                           "for stress period {}".format(iper + 1))
-                ds9 = {}
+                steady = model.dis.steady[iper]
+                if steady and iper > 0:
+                    nflx = 6
+                else:
+                    nflx = 4
+                t = []
                 for n in range(nlakes):
                     line = f.readline().rstrip()
                     if model.array_free_format:
-                        t = line.split()
-                    else:
-                        t = read_fixed_var(line, ncol=6)
-                    tds = []
-                    tds.append(float(t[0]))
-                    tds.append(float(t[1]))
-                    tds.append(float(t[2]))
-                    tds.append(float(t[3]))
-                    if model.dis.steady[iper]:
-                        if iper == 0:
-                            tds.append(stage_range[n][0])
-                            tds.append(stage_range[n][1])
-                        else:
-                            tds.append(float(t[4]))
-                            tds.append(float(t[5]))
+                        t.append(line.split()[:nflx])
                     else:
-                        tds.append(0.)
-                        tds.append(0.)
-                    ds9[n] = tds
-                flux_data[iper] = ds9
+                        t.append(read_fixed_var(line, ncol=6)[:nflx])
+                # convert the whole block at once
+                ds9 = np.zeros((nlakes, 6), dtype=np.float)
+                ds9[:, :nflx] = np.array(t, dtype=np.float)
+                if steady and iper == 0:
+                    ds9[:, 4:] = stage_range
+                ds9 = ds9.tolist()
+                flux_data[iper] = {n: ds9[n] for n in range(nlakes)}
 
         # convert lake data to Transient3d objects
         lake_loc = Transient3d(model, (nlay, nrow, ncol), np.int,
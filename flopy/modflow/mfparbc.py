@@ -4,6 +4,7 @@ the ModflowParBc class as `flopy.modflow.ModflowParBc`.
 
 """
 
+from itertools import islice
 import numpy as np
 
 
@@ -100,20 +101,25 @@ class ModflowParBc(object):
                         instnam = t[0].lower()
                     else:
                         instnam = 'static'
-                    bcinst = []
-                    for nw in range(nlst):
-                        line = f.readline()
-                        t = line.strip().split()
-                        bnd = []
-                        for jdx in range(nitems):
-                            # if jdx < 3:
-                            if issubclass(dt[jdx].type, np.integer):
-                                # conversion to zero-based occurs in package load method in mbase.
-                                bnd.append(int(t[jdx]))
-                            else:
-                                bnd.append(float(t[jdx]))
-                        bcinst.append(bnd)
-                    pinst[instnam] = bcinst
+                    # read the instance records as a single block
+                    lines = list(islice(iter(f.readline, ''), nlst))
+                    assert len(lines) == nlst, \
+                        'ModflowParBc.load() error: end of file reached ' + \
+                        'before reading {} records '.format(nlst) + \
+                        'for parameter "{}"'.format(parnam)
+                    # convert the records one column at a time; integer
+                    # fields are converted with int() so that non-integral
+                    # values raise a ValueError.
+                    # conversion to zero-based occurs in package load method in mbase.
+                    t = [line.strip().split()[:nitems] for line in lines]
+                    bcinst = np.zeros(nlst, dtype=dt)
+                    for jdx, name in enumerate(dt.names):
+                        col = [v[jdx] for v in t]
+                        if issubclass(dt[jdx].type, np.integer):
+                            bcinst[name] = [int(v) for v in col]
+                        else:
+                            bcinst[name] = np.array(col, dtype=np.float64)
+                    pinst[instnam] = bcinst.tolist()
                 bc_parms[parnam] = [{'partyp': partyp, 'parval': parval,
                                      'nlst': nlst, 'timevarying': timeVarying},
                                     pinst]
@@ -9,6 +9,7 @@ from __future__ import print_function
 
 import os
 import webbrowser as wb
+from itertools import islice
 
 import numpy as np
 from numpy.lib.recfunctions import stack_arrays
@@ -16,6 +17,28 @@ from numpy.lib.recfunctions import stack_arrays
 from .modflow.mfparbc import ModflowParBc as mfparbc
 from .utils import Util2d, Util3d, Transient2d, MfList, check
 
+# stress period blocks with fewer records than this are converted from a
+# list of record tuples instead of through a float array
+_SMALL_LIST_BLOCK = 32
+
+
+def _fill_records(recarray, vals):
+    """
+    Fill the fields of recarray from the columns of the 2-D float array
+    vals.  Returns None, leaving the records to be parsed some other way,
+    if an integer field has a non-integral value.
+
+    """
+    names = recarray.dtype.names
+    for idx, name in enumerate(names):
+        col = vals[:, idx]
+        if recarray.dtype[name].kind in 'iu' and \
+                not np.array_equal(col, np.floor(col)):
+            return None
+    for idx, name in enumerate(names):
+        recarray[name] = vals[:, idx]
+    return recarray
+
 
 class Package(object):
     """
@@ -625,7 +648,7 @@ class Package(object):
 
         if not hasattr(f, 'read'):
             filename = f
-            f = open(filename, 'r')
+            f = open(filename, 'r', 1 << 20)
         # dataset 0 -- header
         while True:
             line = f.readline()
@@ -654,14 +677,15 @@ class Package(object):
         options = []
         aux_names = []
         if len(t) > 2:
-            it = 2
-            while it < len(t):
-                toption = t[it]
-                if toption.lower() is 'noprint':
-                    options.append(toption)
-                elif 'aux' in toption.lower():
-                    options.append(' '.join(t[it:it + 2]))
-                    aux_names.append(t[it + 1].lower())
+            toptions = [toption.lower() for toption in t[2:]]
+            it = 0
+            while it < len(toptions):
+                toption = toptions[it]
+                if toption == 'noprint':
+                    options.append(t[it + 2])
+                elif toption.startswith('aux'):
+                    options.append(' '.join(t[it + 2:it + 4]))
+                    aux_names.append(toptions[it + 1])
                     it += 1
                 it += 1
 
@@ -692,12 +716,14 @@ class Package(object):
                 pack_type).lower():
             partype = ['shead', 'ehead']
 
+        # get the package dtype, including any auxiliary variables
+        dtype = pack_type.get_empty(0, aux_names=aux_names,
+                                    structured=model.structured).dtype
+
         # read parameter data
         if nppak > 0:
-            dt = pack_type.get_empty(1, aux_names=aux_names,
-                                     structured=model.structured).dtype
-            pak_parms = mfparbc.load(f, nppak, dt, model.verbose)
-            # pak_parms = mfparbc.load(f, nppak, len(dt.names))
+            pak_parms = mfparbc.load(f, nppak, dtype, model.verbose)
+            # pak_parms = mfparbc.load(f, nppak, len(dtype.names))
 
         if nper is None:
             nrow, ncol, nlay, nper = model.get_nrow_ncol_nlay_nper()
@@ -729,49 +755,92 @@ class Package(object):
             elif itmp > 0:
                 current = pack_type.get_empty(itmp, aux_names=aux_names,
                                               structured=model.structured)
-                for ibnd in range(itmp):
-                    line = f.readline()
-                    if "open/close" in line.lower():
-                        # need to strip out existing path seps and
-                        # replace current-system path seps
-                        raw = line.strip().split()
-                        fname = raw[1]
-                        if '/' in fname:
-                            raw = fname.split('/')
-                        elif '\\' in fname:
-                            raw = fname.split('\\')
-                        else:
-                            raw = [fname]
-                        fname = os.path.join(*raw)
-                        oc_filename = os.path.join(model.model_ws, fname)
-                        assert os.path.exists(
-                            oc_filename), "Package.load() error: open/close filename " + \
-                                          oc_filename + " not found"
-                        try:
-                            current = np.genfromtxt(oc_filename,
-                                                    dtype=current.dtype)
-                            current = current.view(np.recarray)
-                        except Exception as e:
-                            raise Exception(
-                                "Package.load() error loading open/close file " + oc_filename + \
-                                " :" + str(e))
-                        assert current.shape[
-                                   0] == itmp, "Package.load() error: open/close rec array from file " + \
-                                               oc_filename + " shape (" + str(
-                            current.shape) + \
-                                               ") does not match itmp: {0:d}".format(
-                                                   itmp)
-                        break
+                line = f.readline()
+                if "open/close" in line.lower():
+                    # need to strip out existing path seps and
+                    # replace current-system path seps
+                    raw = line.strip().split()
+                    fname = raw[1]
+                    if '/' in fname:
+                        raw = fname.split('/')
+                    elif '\\' in fname:
+                        raw = fname.split('\\')
+                    else:
+                        raw = [fname]
+                    fname = os.path.join(*raw)
+                    oc_filename = os.path.join(model.model_ws, fname)
+                    assert os.path.exists(
+                        oc_filename), "Package.load() error: open/close filename " + \
+                                      oc_filename + " not found"
                     try:
-                        t = line.strip().split()
-                        current[ibnd] = tuple(t[:len(current.dtype.names)])
-                    except:
-                        t = []
-                        for ivar in range(len(current.dtype.names)):
-                            istart = ivar * 10
-                            istop = istart + 10
-                            t.append(line[istart:istop])
-                        current[ibnd] = tuple(t[:len(current.dtype.names)])
+                        current = np.genfromtxt(oc_filename,
+                                                dtype=current.dtype)
+                        current = current.view(np.recarray)
+                    except Exception as e:
+                        raise Exception(
+                            "Package.load() error loading open/close file " + oc_filename + \
+                            " :" + str(e))
+                    assert current.shape[
+                               0] == itmp, "Package.load() error: open/close rec array from file " + \
+                                           oc_filename + " shape (" + str(
+                        current.shape) + \
+                                           ") does not match itmp: {0:d}".format(
+                                               itmp)
+                else:
+                    # read the remaining records for the stress period as a
+                    # single block and parse them with numpy
+                    lines = [line] + list(islice(iter(f.readline, ''),
+                                                 itmp - 1))
+                    assert len(lines) == itmp, \
+                        "Package.load() error: end of file reached " + \
+                        "before reading {0:d} records".format(itmp)
+                    names = current.dtype.names
+                    nitems = len(names)
+                    bnd = None
+                    if itmp < _SMALL_LIST_BLOCK:
+                        # small blocks are converted in a single call from a
+                        # list of record tuples
+                        try:
+                            bnd = np.array([tuple(line.strip().split()[:nitems])
+                                            for line in lines],
+                                           dtype=current.dtype)
+                        except:
+                            bnd = None
+                    else:
+                        # records that only contain the required items can
+                        # be parsed in a single pass into a float array
+                        if all(len(line.split()) == nitems
+                               for line in lines):
+                            try:
+                                vals = np.fromstring(' '.join(lines), sep=' ')
+                            except ValueError:
+                                vals = np.zeros(0)
+                            if vals.size == itmp * nitems:
+                                bnd = _fill_records(current,
+                                                    vals.reshape(itmp, -1))
+                    if bnd is None:
+                        try:
+                            usecols = list(range(nitems))
+                            vals = np.loadtxt(lines, usecols=usecols, ndmin=2)
+                            bnd = _fill_records(current, vals)
+                        except:
+                            bnd = None
+                    if bnd is not None and bnd.shape[0] == itmp:
+                        current = bnd.view(np.recarray)
+                    else:
+                        # fall back to parsing one record at a time to
+                        # support fixed format records
+                        for ibnd, line in enumerate(lines):
+                            try:
+                                t = line.strip().split()
+                                current[ibnd] = tuple(t[:nitems])
+                            except:
+                                t = []
+                                for ivar in range(nitems):
+                                    istart = ivar * 10
+                                    istop = istart + 10
+                                    t.append(line[istart:istop])
+                                current[ibnd] = tuple(t[:nitems])
 
                 # convert indices to zero-based
                 if model.structured:
@@ -780,12 +849,18 @@ class Package(object):
                     current['j'] -= 1
                 else:
                     current['node'] -= 1
-                bnd_output = np.recarray.copy(current)
+                # current is allocated for this stress period so it can be
+                # used without making a copy
+                bnd_output = current
             else:
+                # reuse the records from the previous stress period
                 bnd_output = np.recarray.copy(current)
 
-            for iparm in range(itmpp):
-                line = f.readline()
+            plines = list(islice(iter(f.readline, ''), max(itmpp, 0)))
+            assert len(plines) == max(itmpp, 0), \
+                "Package.load() error: end of file reached " + \
+                "before reading {0:d} parameter records".format(itmpp)
+            for line in plines:
                 t = line.strip().split()
                 pname = t[0].lower()
                 iname = 'static'
@@ -814,9 +889,12 @@ class Package(object):
                     except:
                         parval = np.float(par_dict['parval'])
 
-                # fill current parameter data (par_current)
-                for ibnd, t in enumerate(data_dict):
-                    par_current[ibnd] = tuple(t[:len(par_current.dtype.names)])
+                # fill current parameter data (par_current) one field at a
+                # time from the parsed parameter records
+                if len(data_dict) > 0:
+                    bnd = np.array(data_dict)
+                    for idx, name in enumerate(par_current.dtype.names):
+                        par_current[name] = bnd[:, idx]
 
                 if model.structured:
                     par_current['k'] -= 1
@@ -839,9 +917,6 @@ class Package(object):
             else:
                 stress_period_data[iper] = bnd_output
 
-        dtype = pack_type.get_empty(0, aux_names=aux_names,
-                                    structured=model.structured).dtype
-
         # set package unit number
         unitnumber = None
         filenames = [None, None]
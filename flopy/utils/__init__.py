@@ -34,7 +34,7 @@ from .mflistfile import MfListBudget, MfusgListBudget, SwtListBudget, \
     SwrListBudget
 from .check import check, get_neighbors
 from .utils_def import FlopyBinaryData, totim_to_datetime
-from .flopy_io import read_fixed_var, write_fixed_var
+from .flopy_io import read_fixed_var, write_fixed_var, fixed_fmt_string
 from .zonbud import ZoneBudget, read_zbarray, write_zbarray
 from .mfgrdfile import MfGrdFile
 from .postprocessing import get_transmissivities
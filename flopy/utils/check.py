@@ -293,8 +293,8 @@ class check:
         values, and description of error for each row in stress_period_data where criteria=True.
         """
         inds_col = ['k', 'i', 'j'] if self.structured else ['node']
-        inds = stress_period_data[criteria][inds_col].view(int)\
-            .reshape(stress_period_data[criteria].shape + (-1,))
+        inds = np.column_stack([stress_period_data[criteria][c]
+                                for c in inds_col]).astype(int)
         if col is not None:
             v = stress_period_data[criteria][col]
         else:
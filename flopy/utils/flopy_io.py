@@ -58,6 +58,42 @@ def pop_item(line, dtype=str):
             return int(float(line.pop(0)))
     return 0
 
+_fixed_fmt_cache = {}
+
+def fixed_fmt_string(ipos, free=False):
+    """
+    Return the format string for a record with user-provided column widths.
+    Strings are cached since the same layouts are written over and over.
+
+    Parameters
+    ----------
+    ipos : list, tuple, or int
+        column widths of the record.
+    free : bool
+        boolean indicating if a free format string should be generated.
+        ipos is only used for the number of columns if free is True.
+        (default is False)
+
+    Returns
+    -------
+    fmt_string : str
+        format string for the record that can be filled with str.format()
+
+    """
+    if isinstance(ipos, int):
+        ipos = (ipos,)
+    key = (tuple(ipos), free)
+    fmt_string = _fixed_fmt_cache.get(key)
+    if fmt_string is None:
+        if free:
+            fmt_string = '{} ' * len(ipos)
+        else:
+            fmt_string = ''.join('{{:>{}}}'.format(i) for i in ipos)
+        if len(_fixed_fmt_cache) >= 128:
+            _fixed_fmt_cache.clear()
+        _fixed_fmt_cache[key] = fmt_string
+    return fmt_string
+
 def write_fixed_var(v, length=10, ipos=None, free=False, comment=None):
     """
 
@@ -83,18 +119,16 @@ def write_fixed_var(v, length=10, ipos=None, free=False, comment=None):
 
     """
     if isinstance(v, np.ndarray):
-        v = v.aslist()
+        v = v.tolist()
     elif isinstance(v, int) or isinstance(v, float) or isinstance(v, bool):
         v = [v]
     ncol = len(v)
     # construct ipos if it was not passed
     if ipos is None:
-        ipos = []
-        for i in range(ncol):
-            ipos.append(length)
+        ipos = (length,) * ncol
     else:
         if isinstance(ipos, np.ndarray):
-            ipos = ipos.flatten().aslist()
+            ipos = ipos.flatten().tolist()
         elif isinstance(ipos, int):
             ipos = [ipos]
         if len(ipos) < ncol:
@@ -102,13 +136,8 @@ def write_fixed_var(v, length=10, ipos=None, free=False, comment=None):
                   'should be greater than or equal ' + \
                   'to the length of v ({})'.format(ncol)
             raise Exception(err)
-    out = ''
-    for n in range(ncol):
-        if free:
-            write_fmt = '{} '
-        else:
-            write_fmt = '{{:>{}}}'.format(ipos[n])
-        out += write_fmt.format(v[n])
+        ipos = tuple(ipos[:ncol])
+    out = fixed_fmt_string(ipos, free).format(*v)
     if comment is not None:
         out += '  # {}'.format(comment)
     out += '\n'
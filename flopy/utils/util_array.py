@@ -2278,13 +2278,13 @@ class Util2d(object):
         # nrow,ncol = self.shape
         nrow, ncol = shape
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        data = np.zeros((nrow * ncol), dtype=dtype) + np.NaN
-        d = 0
+        nval = nrow * ncol
+        values = []
         if not hasattr(file_in, 'read'):
             file_in = open(file_in, 'r')
-        while True:
+        while len(values) < nval:
             line = file_in.readline()
-            if line in [None, ''] or d == nrow * ncol:
+            if line in [None, '']:
                 break
             if npl == 'free':
                 raw = line.strip('\n').split()
@@ -2326,21 +2326,22 @@ class Util2d(object):
                     istart = istop
                     istop += width
                 raw = rawlist
+            values.extend(raw)
 
-            for a in raw:
+        if len(values) < nval:
+            raise Exception("Util2d.load_txt() error: np.NaN in data array")
+        # cast all of the values in one call
+        values = values[:nval]
+        try:
+            data = np.array(values, dtype=dtype)
+        except:
+            data = np.empty(nval, dtype=dtype)
+            for i, a in enumerate(values):
                 try:
-                    data[d] = dtype(a)
+                    data[i] = dtype(a)
                 except:
                     raise Exception('Util2d:unable to cast value: ' +
                                     str(a) + ' to type:' + str(dtype))
-                if d == (nrow * ncol) - 1:
-                    assert len(data) == (nrow * ncol)
-                    data.resize(nrow, ncol)
-                    return data
-                d += 1
-                #        file_in.close()
-        if np.isnan(np.sum(data)):
-            raise Exception("Util2d.load_txt() error: np.NaN in data array")
         data.resize(nrow, ncol)
         return data
 
@@ -2379,10 +2380,15 @@ class Util2d(object):
             column_length, fmt, width, decimal = \
                 ArrayFormat.decode_fortran_descriptor(fortran_format)
             if decimal is None:
-                output_fmt = '{0}0:{1}{2}{3}'.format('{', width, 'd', '}')
+                # integer formats are not applied to float data
+                if data.dtype.kind not in 'iub':
+                    raise Exception("error writing array value: " +
+                                    "integer format {0} ".format(
+                                        fortran_format) +
+                                    "used for {0} data".format(data.dtype))
+                output_fmt = '%{0}d'.format(width)
             else:
-                output_fmt = '{0}0:{1}.{2}{3}{4}'.format('{', width, decimal,
-                                                         fmt, '}')
+                output_fmt = '%{0}.{1}{2}'.format(width, decimal, fmt)
         else:
             try:
                 column_length, output_fmt = int(python_format[0]), \
@@ -2394,26 +2400,32 @@ class Util2d(object):
                                 + '  python_format should be a list with\n'
                                 + '   [column_length, fmt]\n'
                                 + '    e.g., [10, {0:10.2e}]')
-        if ncol % column_length == 0:
-            linereturnflag = False
+        # column index that ends each line of a wrapped row
+        ends = [j + 1 for j in range(ncol)
+                if (j + 1) % column_length == 0 and (j != 0 or ncol == 1)]
+        if ncol % column_length != 0:
+            ends.append(ncol)
+        spans = list(zip([0] + ends[:-1], ends))
+        # format all of the values at once
+        if python_format is None:
+            values = np.char.mod(output_fmt, data[:nrow, :ncol]).tolist()
         else:
-            linereturnflag = True
-        # write the array to a string
-        s = ""
-        for i in range(nrow):
-            icol = 0
-            for j in range(ncol):
+            values = []
+            for i in range(nrow):
                 try:
-                    s = s + output_fmt.format(data[i, j])
+                    values.append([output_fmt.format(v)
+                                   for v in data[i, :ncol]])
                 except Exception as e:
                     raise Exception("error writing array value" + \
-                                    "{0} at r,c [{1},{2}]\n{3}".format(
-                                        data[i, j], i, j, str(e)))
-                if (j + 1) % column_length == 0.0 and (j != 0 or ncol == 1):
-                    s += '\n'
-            if linereturnflag:
-                s += '\n'
-        return s
+                                    " in row {0}\n{1}".format(i, str(e)))
+        # write the array to a string
+        lines = []
+        for row in values:
+            for i0, i1 in spans:
+                lines.append(''.join(row[i0:i1]))
+        if len(lines) == 0:
+            return ''
+        return '\n'.join(lines) + '\n'
 
     @staticmethod
     def load_bin(shape, file_in, dtype, bintype=None):
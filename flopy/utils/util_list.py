@@ -327,6 +327,10 @@ class MfList(object):
             self.__vtype[kper] = None
 
     def __cast_recarray(self, kper, d):
+        # cast recarrays with the same fields (e.g. int64 instead of int32
+        # cell indices) to the package dtype
+        if d.dtype != self.__dtype and d.dtype.names == self.__dtype.names:
+            d = d.astype(self.__dtype)
         assert d.dtype == self.__dtype, "MfList error: recarray dtype: " + \
                                         str(d.dtype) + " doesn't match " + \
                                         "self dtype: " + str(self.dtype)